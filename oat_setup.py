@@ -1,25 +1,76 @@
 #!/usr/bin/env python3
 
-import argparse
-import math
 import os
-import re
 import serial
+import sys
+import termios
 import time
 from datetime import datetime
 
 
+# Fixed protocol commands, full doc comments at the call sites
+_CMD_GET_PRODUCT_NAME = b':GVP#'
+_CMD_GET_FIRMWARE_VERSION = b':GVN#'
+_CMD_INITIALIZE = b':I#'
+_CMD_GET_LATITUDE = b':Gt#'
+_CMD_GET_LONGITUDE = b':Gg#'
+_CMD_GET_LOCAL_TIME = b':GL#'
+_CMD_GET_DATE = b':GC#'
+_CMD_GET_UTC_OFFSET = b':GG#'
+_CMD_GET_STATUS = b':GX#'
+_CMD_AUTOHOME_RA = b':MHRR#'
+_CMD_SET_HOME_POINT = b':SHP#'
+
+
+def _parse_signed_dm(value, min_deg_digits, max_deg_digits):
+    # Parse a signed degree/minute string 'sDD*MM' (fixed-width, so plain
+    # slicing and isdigit checks are enough - no regex engine needed).
+    # Returns (degrees, minutes) with the sign applied to degrees.
+    # Raises ValueError if the string is malformed.
+    star = value.find('*')
+    if not 1 + min_deg_digits <= star <= 1 + max_deg_digits:
+        raise ValueError(f"malformed coordinate '{value}'")
+
+    if value[0] not in '+-':
+        raise ValueError(f"malformed coordinate '{value}'")
+
+    deg_part = value[1:star]
+    min_part = value[star + 1:]
+    if not (deg_part.isdigit() and len(min_part) == 2 and min_part.isdigit()):
+        raise ValueError(f"malformed coordinate '{value}'")
+
+    return int(value[:star]), int(min_part)
+
+
 def oat_read_response(serial_port):
-    return serial_port.readline().decode('utf-8')
+    # OAT responses are '#'-terminated, not newline-terminated, so
+    # read_until returns as soon as the terminator arrives instead of
+    # waiting out the timeout for a newline that never comes. pyserial
+    # buffers internally, so this is one driver call per response rather
+    # than one per byte. On timeout the result is short (no trailing
+    # '#'), which the callers detect.
+    #
+    # Responses stay bytes - the protocol is plain ASCII and callers
+    # only decode at the print boundary.
+    return serial_port.read_until(b'#', size=128)
 
 def oat_send_command(serial_port, command):
-    serial_port.write(str.encode(command))
+    # Commands are bytes - the protocol is plain ASCII, so there is
+    # nothing to encode per call
+    serial_port.write(command)
 
 
 def oat_read_response_status(serial_port, command):
-    response = oat_read_response(serial_port)
-    return len(response) > 0 and response[0] == '1'
-        
+    # Status replies are a single '0'/'1' character with no terminator,
+    # so read exactly one byte instead of waiting out the timeout for a
+    # '#' that never arrives
+    response = serial_port.read(1)
+
+    if response not in (b'0', b'1'):
+        raise Exception(f"Expected status response from command '{command}', response was '{response}'")
+
+    return response == b'1'
+
 
 def oat_send_command_status(serial_port, command):
     oat_send_command(serial_port, command)
@@ -30,8 +81,7 @@ def oat_read_response_string(serial_port, command):
     response = oat_read_response(serial_port)
 
     # Expect response to end with '#'
-    expected_hash = response[-1]
-    if expected_hash != '#':
+    if not response.endswith(b'#'):
         raise Exception(f"Expected response from command '{command}' to end with '#', response was '{response}'")
 
     return response[:-1]
@@ -42,16 +92,136 @@ def oat_send_command_string(serial_port, command):
     return oat_read_response_string(serial_port, command)
 
 
+def oat_send_commands(serial_port, commands):
+    # Pipeline several commands: write the whole burst in one call, then
+    # parse the combined response stream in one pass. The OAT answers in
+    # command order, so this replaces one blocking round-trip per command
+    # with a single one for the burst.
+    #
+    # Each entry is (command, reply_pattern). The reply pattern describes
+    # the response characters per command: 'S' is a single '0'/'1' status
+    # character, '#' is a '#'-terminated string. E.g. ':SC' replies with
+    # a status followed by two '#'-terminated notices, so its pattern is
+    # 'S##'.
+    #
+    # Returns a list with one list of replies per command, in order.
+    serial_port.write(b''.join(command for command, _ in commands))
+
+    buffer = b''
+    results = []
+    for command, reply_pattern in commands:
+        replies = []
+        for expected in reply_pattern:
+            if expected == 'S':
+                while not buffer:
+                    chunk = oat_read_response(serial_port)
+                    if not chunk:
+                        raise Exception(f"Timed out waiting for response to '{command}'")
+                    buffer += chunk
+                replies.append(buffer[:1] == b'1')
+                buffer = buffer[1:]
+            else:
+                while b'#' not in buffer:
+                    chunk = oat_read_response(serial_port)
+                    if not chunk:
+                        raise Exception(f"Timed out waiting for response to '{command}'")
+                    buffer += chunk
+                reply, _, buffer = buffer.partition(b'#')
+                replies.append(reply)
+        results.append(replies)
+    return results
+
+
+def oat_configure_site(serial_port, site_commands, verify=False):
+    # Apply the whole site configuration in pipelined bursts: write
+    # every set command in one call and check the statuses, then - only
+    # when verify is requested - write every get command in one call and
+    # compare the echoed values. The set commands already report
+    # success/failure through their status byte, so the read-back burst
+    # is optional.
+    #
+    # Each entry is a tuple built by the oat_site_*_commands helpers:
+    # (set_command, set_reply, get_command, expected, label, message,
+    # set_value). 'expected' is the echo the get command should return,
+    # or None to skip the comparison. 'message' is the success line with
+    # a '{}' placeholder, filled with the echoed value when verifying
+    # and with 'set_value' otherwise.
+    # The :SC reply trails a planetary-data recalculation notice that
+    # can take noticeably longer than a normal firmware turnaround, so
+    # give the set burst a longer read timeout
+    original_timeout = serial_port.timeout
+    serial_port.timeout = 5.0
+    try:
+        set_replies = oat_send_commands(
+            serial_port,
+            [(set_command, set_reply)
+             for set_command, set_reply, _, _, _, _, _ in site_commands])
+    finally:
+        serial_port.timeout = original_timeout
+
+    for (_, _, _, _, label, _, _), replies in zip(site_commands, set_replies):
+        if not replies[0]:
+            print(f"Error setting {label}...")
+            sys.exit(1)
+
+    if not verify:
+        for _, _, _, _, _, message, set_value in site_commands:
+            print(message.format(set_value))
+        return
+
+    get_replies = oat_send_commands(
+        serial_port,
+        [(get_command, '#')
+         for _, _, get_command, _, _, _, _ in site_commands])
+
+    for (_, _, _, expected, label, message, _), (response,) in zip(site_commands, get_replies):
+        if expected is not None and response != expected:
+            print(f"Error verifying {label}... expected [{expected.decode('ascii')}], got [{response}]")
+            sys.exit(1)
+
+        print(message.format(response.decode('ascii')))
+
+
+def _disable_hupcl(serial_port_path):
+    # Clear HUPCL on a short-lived fd before pyserial opens the port, so
+    # neither the open nor a later close pulses DTR and resets the
+    # Arduino. This is the in-process equivalent of what
+    # 'stty -F <path> -hupcl' does.
+    fd = os.open(serial_port_path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+    try:
+        attrs = termios.tcgetattr(fd)
+        attrs[2] &= ~termios.HUPCL
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    finally:
+        os.close(fd)
+
+
 def open_oat_connection(serial_port_path):
     print('')
     print('- Open OAT serial port -')
 
     # Disable serial port reset on port open
     print(f"Disabling #DTR for {serial_port_path}")
-    os.system(f"stty -F {serial_port_path} -hupcl")
-
-    # Open serial port
-    serial_port = serial.Serial(serial_port_path, 19200, timeout = 1)
+    _disable_hupcl(serial_port_path)
+
+    # Open serial port with exclusive access. All expected responses are
+    # short (at 19200 baud "OpenAstroTracker#" is ~9 ms of wire time),
+    # so a quarter second is plenty of headroom for the firmware
+    # turnaround; the inter-byte timeout makes a stalled mid-response
+    # read fail fast, and the write timeout keeps a wedged port from
+    # blocking sends forever.
+    serial_port = serial.Serial(
+        serial_port_path,
+        19200,
+        timeout=0.25,
+        inter_byte_timeout=0.05,
+        write_timeout=0.5,
+        exclusive=True)
+
+    # Drop any boot chatter or leftovers from a previous session so the
+    # first handshake response cannot be misaligned
+    serial_port.reset_input_buffer()
+    serial_port.reset_output_buffer()
 
     # Check connection
 
@@ -60,18 +230,22 @@ def open_oat_connection(serial_port_path):
     #        Get the Product Name
     #      Returns:
     #        "OpenAstroTracker#"
-    product_name = oat_send_command_string(serial_port, ':GVP#')
-
+    #
     # :GVN#
     #      Description:
     #        Get the Firmware Version Number
     #      Returns:
     #        "V1.major.minor#" from version.h
-    firmware_version = oat_send_command_string(serial_port, ':GVN#')
+    #
+    # Both queries are independent, send them as one pipelined burst
+    (product_name,), (firmware_version,) = oat_send_commands(
+        serial_port,
+        [(_CMD_GET_PRODUCT_NAME, '#'), (_CMD_GET_FIRMWARE_VERSION, '#')])
 
     if len(product_name) <= 0 or len(firmware_version) <= 0 :
         print('Could not connect to OAT, exiting...')
-        quit()
+        serial_port.close()
+        sys.exit(1)
 
     # :I#
     #      Description:
@@ -82,11 +256,11 @@ def open_oat_connection(serial_port_path):
     #        pressing the SELECT key, or programmatically with the :Qq# command.
     #      Returns:
     #        nothing
-    oat_send_command(serial_port, ':I#')
+    oat_send_command(serial_port, _CMD_INITIALIZE)
 
     print('OAT is connected!')
-    print(f"Product Name: {product_name}")
-    print(f"Firmware Version: {firmware_version}")
+    print(f"Product Name: {product_name.decode('ascii')}")
+    print(f"Firmware Version: {firmware_version.decode('ascii')}")
 
     return serial_port
 
@@ -101,26 +275,9 @@ def close_oat_connection(serial_port):
     print('OAT is disconnected!')
 
 
-def oat_set_site_latitude(serial_port, latitude):
-    pat = re.compile(r"^[-\+][0-9][0-9]\*[0-9][0-9]$")
-
-    if not re.fullmatch(pat, latitude):
-        print('Error, latitude not in correct format')
-        quit()
-
-    lat_split = latitude.split('*')
-    
-    lat_deg = lat_split[0]
-    lat_deg_int = int(lat_deg)
-    
-    lat_min = lat_split[1]
-    lat_min_int = int(lat_min)
-
-    if ((lat_deg_int > 90 or lat_deg_int < -90) or
-        (lat_deg_int == 90 and lat_min_int > 0) or
-        (lat_min_int > 60)):
-        print('Error, latitude not in correct value range')
-        quit()
+def oat_site_latitude_commands(latitude):
+    # Format and value range were already validated by the CLI parser
+    lat_deg_int, lat_min_int = _parse_signed_dm(latitude, 2, 2)
 
     #
     # :StsDD*MM#
@@ -136,10 +293,6 @@ def oat_set_site_latitude(serial_port, latitude):
     #        "DD" is the degree (90 or less)
     #        "MM" is minutes
     #
-    if not oat_send_command_status(serial_port, f":St{latitude}#"):
-        print('Error setting Site Latitude...')
-        quit()
-
     # :Gt#
     #      Description:
     #        Get Site Latitude
@@ -149,35 +302,17 @@ def oat_set_site_latitude(serial_port, latitude):
     #        "s" is + or -
     #        "DD" is the latitude in degrees
     #        "MM" the minutes
-    site_latitude_response = oat_send_command_string(serial_port,':Gt#')
-
-    if site_latitude_response != latitude:
-        print(f"Error verifying Site Latitude... expected [{latitude}], got [{site_latitude_response}]")
-        quit()
-
-    print(f"Site Latitude set to: {lat_deg}\u00b0{lat_min}' ({site_latitude_response})")
-
-
-def oat_set_site_longitude(serial_port, longitude):
-    pat = re.compile(r"^[-\+]([0-9])?([0-9])[0-9]\*[0-9][0-9]$")
+    latitude_bytes = latitude.encode('ascii')
+    return (b':St' + latitude_bytes + b'#', 'S',
+            _CMD_GET_LATITUDE, latitude_bytes,
+            'Site Latitude',
+            f"Site Latitude set to: {lat_deg_int:+03d}\u00b0{lat_min_int:02d}' ({{}})",
+            latitude)
 
-    if not re.fullmatch(pat, longitude):
-        print('Error, longitude not in correct format')
-        quit()
 
-    long_split = longitude.split('*')
-
-    long_deg = long_split[0]
-    long_deg_int = int(long_deg)
-    long_min = long_split[1]
-    long_min_int = int(long_min)
-
-    if ((long_deg_int > 180 or long_deg_int < -180) or
-        (long_deg_int == 180 and long_min_int > 0) or
-        (long_deg_int == -180 and long_min_int > 0) or
-        (long_min_int > 60)):
-        print('Error, longitude not in correct value range')
-        quit()
+def oat_site_longitude_commands(longitude):
+    # Format and value range were already validated by the CLI parser
+    long_deg_int, long_min_int = _parse_signed_dm(longitude, 2, 3)
 
     # :SgsDDD*MM#
     #      Description:
@@ -194,10 +329,6 @@ def oat_set_site_longitude(serial_port, longitude):
     #      Remarks:
     #        When a sign is provided, longitudes are interpreted as given, with zero at Greenwich but negative coordinates going east (opposite of normal cartographic coordinates)
     #        When a sign is not provided, longitudes are from 0 to 360 going WEST with 180 at Greenwich. So 369 is 179W and 1 is 179E. 190 would be 10W and 170 would be 10E.
-    if not oat_send_command_status(serial_port, f":Sg{longitude}#"):
-        print('Error setting Site Longitude...')
-        quit()
-
     # :Gg#
     #      Description:
     #        Get Site Longitude
@@ -209,18 +340,15 @@ def oat_set_site_longitude(serial_port, longitude):
     #        "MM" the minutes
     #      Remarks:
     #        Note that this is the actual longitude, but east coordinates are negative (opposite of normal cartographic coordinates)
-    site_longitude_response = oat_send_command_string(serial_port, ':Gg#')
-
-    if site_longitude_response != longitude:
-        print(f"Error verifying Site Longitude... expected [{longitude}], got [{site_longitude_response}]")
-        quit()
+    longitude_bytes = longitude.encode('ascii')
+    return (b':Sg' + longitude_bytes + b'#', 'S',
+            _CMD_GET_LONGITUDE, longitude_bytes,
+            'Site Longitude',
+            f"Site Longitude set to: {long_deg_int:+03d}\u00b0{long_min_int:02d}' ({{}})",
+            longitude)
 
-    print(f"Site Longitude set to: {long_deg}\u00b0{long_min}' ({site_longitude_response})")
-
-
-def oat_set_site_local_time(serial_port, current_datetime):
-    formatted_time = current_datetime.strftime('%H:%M:%S')
 
+def oat_site_local_time_commands(formatted_time):
     # :SLHH:MM:SS#
     #      Description:
     #        Set Site Local Time
@@ -232,10 +360,6 @@ def oat_set_site_local_time(serial_port, current_datetime):
     #        "HH" is hours
     #        "MM" is minutes
     #        "SS" is seconds
-    if not oat_send_command_status(serial_port, f":SL{formatted_time}#"):
-        print('Error setting Site Local Time...')
-        quit()
-
     # :GL#
     #      Description:
     #        Get local time in 24h format
@@ -245,14 +369,14 @@ def oat_set_site_local_time(serial_port, current_datetime):
     #        "HH" are hours
     #        "MM" are minutes
     #        "SS" are seconds of the local time
-    local_time_response = oat_send_command_string(serial_port, ':GL#')
+    return (b':SL' + formatted_time.encode('ascii') + b'#', 'S',
+            _CMD_GET_LOCAL_TIME, None,
+            'Site Local Time',
+            'Site Local Time set to: {}',
+            formatted_time)
 
-    print(f"Site Local Time set to: {local_time_response}")
-
-
-def oat_set_site_date(serial_port, current_datetime):
-    formatted_date = current_datetime.strftime('%m/%d/%y')
 
+def oat_site_date_commands(formatted_date):
     # :SCMM/DD/YY#
     #      Description:
     #        Set Site Date
@@ -264,10 +388,6 @@ def oat_set_site_date(serial_port, current_datetime):
     #        "MM" is the month
     #        "DD" is the day
     #        "YY" is the year since 2000
-    if not oat_send_command_status(serial_port, f":SC{formatted_date}#"):
-        print('Error setting Site Date...')
-        quit()
-
     # :GC#
     #      Description:
     #        Get current date
@@ -277,36 +397,25 @@ def oat_set_site_date(serial_port, current_datetime):
     #        "MM" is the month (1-12)
     #        "day" is the day (1-31)
     #        "year" is the lower two digits of the year
-    current_date_response = oat_send_command_string(serial_port, ':GC#')
-
-    if current_date_response != formatted_date:
-        print(f"Error verifying Site Date... expected [{formatted_date}], got [{current_date_response}]")
-        quit()
-
-    print(f"Site Date set to: {current_date_response}")
-
-
-def oat_set_site_utc_offset(serial_port, current_datetime):
-    iso_8601_parts = current_datetime.isoformat().split('T')
-    if len(iso_8601_parts) != 2:
+    formatted_date_bytes = formatted_date.encode('ascii')
+    return (b':SC' + formatted_date_bytes + b'#', 'S##',
+            _CMD_GET_DATE, formatted_date_bytes,
+            'Site Date',
+            'Site Date set to: {}',
+            formatted_date)
+
+
+def oat_site_utc_offset_commands(current_datetime):
+    # The datetime already knows its UTC offset, no need to re-parse it
+    # out of the isoformat string
+    utc_offset = current_datetime.utcoffset()
+    if utc_offset is None:
         print('Error setting UTC Offset...')
-        quit()
-
-    sign = '+'
-    tz_split = iso_8601_parts[1].split(sign)
-    if len(tz_split) != 2:
-        sign = '-'
-        tz_split = iso_8601_parts[1].split(sign)
-        if len(tz_split) != 2:
-            print('Error setting UTC Offset...')
-            quit()
-
-    tz_parts = tz_split[1].split(':')
-    if len(tz_parts) != 2:
-        print('Error setting UTC Offset...')
-        quit()
+        sys.exit(1)
 
-    tz_hour = sign + tz_parts[0]
+    # Truncate towards zero so e.g. -05:30 becomes -05
+    offset_hours = int(utc_offset.total_seconds() / 3600)
+    tz_hour = f"{offset_hours:+03d}"
 
     # :SGsHH#
     #      Description:
@@ -318,10 +427,6 @@ def oat_set_site_utc_offset(serial_port, current_datetime):
     #      Parameters:
     #        "s" is the sign
     #        "HH" is the number of hours
-    if not oat_send_command_status(serial_port, f":SG{tz_hour}#"):
-        print('Error setting UTC Offset...')
-        quit()
-        
     # :GG#
     #      Description:
     #        Get offset to UTC time
@@ -332,13 +437,57 @@ def oat_set_site_utc_offset(serial_port, current_datetime):
     #        "HH" is the number of hours
     #      Remarks
     #        Note that this is NOT simply the timezone offset you are in (like -8 for Pacific Standard Time), it is the negative of it. So how many hours need to be added to your local time to get to UTC.
-    utc_offset_time_response = oat_send_command_string(serial_port, ':GG#')
+    tz_hour_bytes = tz_hour.encode('ascii')
+    return (b':SG' + tz_hour_bytes + b'#', 'S',
+            _CMD_GET_UTC_OFFSET, tz_hour_bytes,
+            'Site UTC Offset',
+            'Site UTC Offset set to: {}',
+            tz_hour)
 
-    if utc_offset_time_response != tz_hour:
-        print(f"Error verifying Site UTC Offset... expected [{tz_hour}], got [{utc_offset_time_response}]")
-        quit()
 
-    print(f"Site UTC Offset set to: {utc_offset_time_response}")
+def oat_wait_homing_done(serial_port, poll_interval=0.5, timeout=300):
+    # Poll the mount status until homing has finished. Returns True when
+    # the mount leaves the 'Homing' state, False if it has not done so
+    # within the timeout.
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+
+        # :GX#
+        #      Description:
+        #        Get Mount Status
+        #      Information:
+        #         String reflecting the mounts' status. The string is a comma-delimited list of statuses
+        #      Returns:
+        #        "Idle,--T--,11219,0,927,071906,+900000,#"
+        #      Parameters:
+        #        [0] The mount status. One of 'Idle', 'Parked', 'Parking', 'Guiding', 'SlewToTarget', 'FreeSlew', 'ManualSlew', 'Tracking', 'Homing'
+        #        [1] The motion state.
+        #        [2] The RA stepper position
+        #        [3] The DEC stepper position
+        #        [4] The Tracking stepper position
+        #        [5] The current RA position
+        #        [6] The current DEC position
+        #      Remarks:
+        #        The motion state
+        #        First character is RA slewing state ('R' is East, 'r' is West, '-' is stopped).
+        #        Second character is DEC slewing state ('d' is North, 'D' is South, '-' is stopped).
+        #        Third character is TRK slewing state ('T' is Tracking, '-' is stopped).
+        #        Fourth character is AZ slewing state ('Z' and 'z' is adjusting, '-' is stopped).
+        #        Fifth character is ALT slewing state ('A' and 'a' is adjusting, '-' is stopped).
+        #        Az and Alt are optional. The string may only be 3 characters long
+        status_response = oat_send_command_string(serial_port, _CMD_GET_STATUS)
+
+        # Only the mount status field is needed, no point splitting the
+        # whole status tuple
+        mount_state = status_response.partition(b',')[0]
+        print(f"State: {mount_state.decode('ascii')}")
+
+        if mount_state != b'Homing':
+            return True
+
+    return False
 
 
 def oat_autohome_ra(serial_port):
@@ -365,47 +514,16 @@ def oat_autohome_ra(serial_port):
     #      Returns:
     #        "1" returns if search is started
     #        "0" if homing has not been enabled in the local config
-    if not oat_send_command_status(serial_port, ':MHRR#'):
+    if not oat_send_command_status(serial_port, _CMD_AUTOHOME_RA):
         print('RA Auto Home is not enabled...')
         return
 
     print('RA Auto Home search started...')
 
     # Wait for OAT to complete homing
-    while True:
-        time.sleep(0.5)
-
-        # :GX#
-        #      Description:
-        #        Get Mount Status
-        #      Information:
-        #         String reflecting the mounts' status. The string is a comma-delimited list of statuses
-        #      Returns:
-        #        "Idle,--T--,11219,0,927,071906,+900000,#"
-        #      Parameters:
-        #        [0] The mount status. One of 'Idle', 'Parked', 'Parking', 'Guiding', 'SlewToTarget', 'FreeSlew', 'ManualSlew', 'Tracking', 'Homing'
-        #        [1] The motion state.
-        #        [2] The RA stepper position
-        #        [3] The DEC stepper position
-        #        [4] The Tracking stepper position
-        #        [5] The current RA position
-        #        [6] The current DEC position
-        #      Remarks:
-        #        The motion state
-        #        First character is RA slewing state ('R' is East, 'r' is West, '-' is stopped).
-        #        Second character is DEC slewing state ('d' is North, 'D' is South, '-' is stopped).
-        #        Third character is TRK slewing state ('T' is Tracking, '-' is stopped).
-        #        Fourth character is AZ slewing state ('Z' and 'z' is adjusting, '-' is stopped).
-        #        Fifth character is ALT slewing state ('A' and 'a' is adjusting, '-' is stopped).
-        #        Az and Alt are optional. The string may only be 3 characters long
-        status_response = oat_send_command_string(serial_port, ':GX#')
-
-        status_split = status_response.split(',')
-        mount_state = status_split[0]
-        print(f"State: {mount_state}")
-
-        if mount_state != 'Homing':
-            break
+    if not oat_wait_homing_done(serial_port):
+        print('Error, timed out waiting for RA Auto Home...')
+        sys.exit(1)
 
     # :SHP#
     #      Description:
@@ -414,88 +532,138 @@ def oat_autohome_ra(serial_port):
     #        This sets the current orientation of the scope as its home point.
     #      Returns:
     #        "1"
-    if not oat_send_command_status(serial_port, ':SHP#'):
+    if not oat_send_command_status(serial_port, _CMD_SET_HOME_POINT):
         print('Error setting Home Point...')
-        quit()
+        sys.exit(1)
 
     print('Current orientation set as Home Point')
 
 
-#
-# Setup args parser
-#
-
-arg_parser = argparse.ArgumentParser(description='OAT Setup')
-
-arg_parser.add_argument(
-    '--latitude',
-    type=str,
-    action='store',
-    default='+51*28',
-    help='The latitude sDDD*MM, positive (+) for northern hemisphere, negative (-) for southern (default: %(default)s)'
-)
-
-arg_parser.add_argument(
-    '--longitude',
-    type=str,
-    action='store',
-    default='+00*00',
-    help='The longitude sDD*MM, positive (+) for western hemisphere, negative (-) for eastern (default: %(default)s)'
-)
-
-arg_parser.add_argument(
-    'serial_port',
-    type=str,
-    nargs='?',
-    default='/dev/ttyUSB0',
-    help='The serial port path (default: %(default)s)'
-)
-
-args = arg_parser.parse_args()
-
-#
-# Print args
-#
-
-print('--- OAT Setup ---')
-print(f"Serial port: {args.serial_port}")
-print(f"Latitude: {args.latitude}")
-print(f"Longitude: {args.longitude}")
-
-#
-# Setup serial port connection
-#
-
-serial_port = open_oat_connection(args.serial_port)
-
-#
-# Set Site Coordinates
-#
-
-print('')
-print('- Set Site Coordinates -')
-oat_set_site_latitude(serial_port, args.latitude)
-oat_set_site_longitude(serial_port, args.longitude)
-
-#
-# Set Site Local Time, Date and UTC Offset
-#
-
-print('')
-print('- Set Site Local Time -')
-now = datetime.now().astimezone()
-oat_set_site_utc_offset(serial_port, now)
-oat_set_site_local_time(serial_port, now)
-oat_set_site_date(serial_port, now)
-
-#
-# AutoHome RA
-#
-
-oat_autohome_ra(serial_port)
-
-#
-# Close serial port connection
-#
-
-close_oat_connection(serial_port)
+def parse_args():
+    # argparse is only needed when running as a CLI, import it lazily so
+    # importing this module stays cheap
+    import argparse
+
+    # Validate coordinates while parsing arguments, so a bad value fails
+    # here instead of after the serial port has already been configured
+    def latitude_arg(value):
+        try:
+            lat_deg_int, lat_min_int = _parse_signed_dm(value, 2, 2)
+        except ValueError:
+            raise argparse.ArgumentTypeError('latitude not in correct format')
+
+        if ((lat_deg_int > 90 or lat_deg_int < -90) or
+            (lat_deg_int == 90 and lat_min_int > 0) or
+            (lat_min_int > 60)):
+            raise argparse.ArgumentTypeError('latitude not in correct value range')
+
+        return value
+
+    def longitude_arg(value):
+        try:
+            long_deg_int, long_min_int = _parse_signed_dm(value, 2, 3)
+        except ValueError:
+            raise argparse.ArgumentTypeError('longitude not in correct format')
+
+        if ((long_deg_int > 180 or long_deg_int < -180) or
+            (long_deg_int == 180 and long_min_int > 0) or
+            (long_deg_int == -180 and long_min_int > 0) or
+            (long_min_int > 60)):
+            raise argparse.ArgumentTypeError('longitude not in correct value range')
+
+        return value
+
+    arg_parser = argparse.ArgumentParser(description='OAT Setup')
+
+    arg_parser.add_argument(
+        '--latitude',
+        type=latitude_arg,
+        action='store',
+        default='+51*28',
+        help='The latitude sDDD*MM, positive (+) for northern hemisphere, negative (-) for southern (default: %(default)s)'
+    )
+
+    arg_parser.add_argument(
+        '--longitude',
+        type=longitude_arg,
+        action='store',
+        default='+00*00',
+        help='The longitude sDD*MM, positive (+) for western hemisphere, negative (-) for eastern (default: %(default)s)'
+    )
+
+    arg_parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Read back and verify each site setting after it is set'
+    )
+
+    arg_parser.add_argument(
+        'serial_port',
+        type=str,
+        nargs='?',
+        default='/dev/ttyUSB0',
+        help='The serial port path (default: %(default)s)'
+    )
+
+    return arg_parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    #
+    # Print args
+    #
+
+    print('--- OAT Setup ---')
+    print(f"Serial port: {args.serial_port}")
+    print(f"Latitude: {args.latitude}")
+    print(f"Longitude: {args.longitude}")
+
+    #
+    # Setup serial port connection
+    #
+
+    serial_port = open_oat_connection(args.serial_port)
+
+    # Always close the serial port, also when a setup step exits with an
+    # error
+    try:
+        #
+        # Set Site Coordinates, Local Time, Date and UTC Offset in one
+        # pipelined batch
+        #
+
+        print('')
+        print('- Set Site Configuration -')
+        now = datetime.now().astimezone()
+
+        # The :SL and :SC parameters are fixed-width numeric, format
+        # them straight from the datetime fields instead of going
+        # through the locale-aware strftime machinery
+        formatted_time = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+        formatted_date = f"{now.month:02d}/{now.day:02d}/{now.year % 100:02d}"
+
+        oat_configure_site(serial_port, [
+            oat_site_latitude_commands(args.latitude),
+            oat_site_longitude_commands(args.longitude),
+            oat_site_utc_offset_commands(now),
+            oat_site_local_time_commands(formatted_time),
+            oat_site_date_commands(formatted_date),
+        ], verify=args.verify)
+
+        #
+        # AutoHome RA
+        #
+
+        oat_autohome_ra(serial_port)
+    finally:
+        #
+        # Close serial port connection
+        #
+
+        close_oat_connection(serial_port)
+
+
+if __name__ == '__main__':
+    main()